@@ -106,24 +106,44 @@ tool_dir
     set to ``/opt/uv/tools``.
 """
 
+import asyncio
+import atexit
+import contextvars
+import copy
+import glob
+import importlib.util
 import logging
 import os
 import re
 import shlex
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
-import salt.utils.json
 import salt.utils.platform
-from packaging.specifiers import SpecifierSet
-from packaging.version import Version
 from salt.exceptions import CommandExecutionError, SaltInvocationError
 
+# Optional dependencies are imported on first use, which keeps loading
+# this module cheap.
+HAS_AIOHTTP = importlib.util.find_spec("aiohttp") is not None
+
+HAS_HTTPX = importlib.util.find_spec("httpx") is not None
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
 __virtualname__ = "uv"
 
 log = logging.getLogger(__name__)
 
+_HTTP_CLIENT = None
+
+NORMALIZE_REGEX = re.compile(r"[-_.]+")
+# Lines starting with `-` list executables and are skipped.
+# Matches must not span lines, hence only horizontal whitespace is allowed.
 LIST_REGEX = re.compile(
-    r"^(?P<tool>\S+)\s+v?(?P<version>\S+)(?:\s+\[required: (?P<req>[^\]]*)\])?\s+\((?P<venv>.*)\)$"
+    r"^(?!-)(?P<tool>\S+)[ \t]+v?(?P<version>\S+)(?:[ \t]+\[required: (?P<req>[^\]\n]*)\])?[ \t]+\((?P<venv>.*)\)\r?$",
+    re.MULTILINE,
 )
 
 
@@ -133,6 +153,25 @@ def __virtual__():
     return __virtualname__
 
 
+def _loads(data):
+    # orjson parses index responses several times faster
+    if HAS_ORJSON:
+        import orjson
+
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
+
+
+@lru_cache(maxsize=4096)
+def _ver(version):
+    # Version parsing is regex-heavy, parsed versions are immutable.
+    from packaging.version import Version
+
+    return Version(version)
+
+
 def _uv(
     cmd,
     *params,
@@ -157,39 +196,43 @@ def _uv(
             "The following keyword arguments are invalid: "
             + ", ".join(kwarg for kwarg in kwargs if not kwarg.startswith("__"))
         )
-    full_cmd = ["uv"] + cmd + (options or [])
-
-    for bool_opt, bool_val in (
-        ("no-cache", no_cache),
-        ("no-config", no_config),
-        ("native-tls", native_tls),
-        ("offline", offline),
-        ("no-python-downloads", no_python_downloads),
-    ):
-        if bool_val is True:
-            full_cmd.append(f"--{bool_opt}")
-
-    for opt, val in (
-        ("cache-dir", cache_dir),
-        ("directory", directory),
-        ("project", project),
-        ("config-file", config_file),
-        ("python-preference", python_preference),
-    ):
-        if val is not None:
-            full_cmd.extend((f"--{opt}", val))
+    full_cmd = ["uv", *cmd]
+    if options:
+        full_cmd.extend(options)
+
+    if no_cache is True:
+        full_cmd.append("--no-cache")
+    if no_config is True:
+        full_cmd.append("--no-config")
+    if native_tls is True:
+        full_cmd.append("--native-tls")
+    if offline is True:
+        full_cmd.append("--offline")
+    if no_python_downloads is True:
+        full_cmd.append("--no-python-downloads")
+
+    if cache_dir is not None:
+        full_cmd.extend(("--cache-dir", cache_dir))
+    if directory is not None:
+        full_cmd.extend(("--directory", directory))
+    if project is not None:
+        full_cmd.extend(("--project", project))
+    if config_file is not None:
+        full_cmd.extend(("--config-file", config_file))
+    if python_preference is not None:
+        full_cmd.extend(("--python-preference", python_preference))
 
     full_cmd.extend(params)
 
     log.debug("Running command %r with env %r and user %s", full_cmd, env, user)
-    res = __salt__["cmd.run_all"](shlex.join(full_cmd), env=env, runas=user)
+    res = __salt__["cmd.run_all"](full_cmd, env=env, runas=user, python_shell=False)
     if res["retcode"]:
         raise CommandExecutionError(
             f"Failed running '{shlex.join(full_cmd)}': {res['stderr'] or res['stdout']}"
         )
     if not json:
         return res["stdout"]
-    return salt.utils.json.loads(res["stdout"])
+    return _loads(res["stdout"])
 
 
 def _uv_tool(
@@ -202,7 +245,7 @@ def _uv_tool(
     user=None,
     **kwargs,
 ):
-    env = env or {}
+    env = dict(env or {})
     if system is None and user is None and os.getuid() == 0:
         system = True
     if system:
@@ -215,6 +258,40 @@ def _uv_tool(
     return _uv(["tool", cmd], *params, env=env, user=user, **kwargs)
 
 
+def _get_tool_dir(system=None, user=None, tool_dir=None, env=None):
+    # Mirrors the directory _uv_tool makes uv use for tool environments.
+    # Returns None when it depends on the (unknown) environment of another user.
+    if system is None and user is None and os.getuid() == 0:
+        system = True
+    if system:
+        return tool_dir or "/opt/uv/tools"
+    if tool_dir is not None:
+        return tool_dir
+    if env and env.get("UV_TOOL_DIR"):
+        return env["UV_TOOL_DIR"]
+    if user is not None:
+        return None
+    if os.environ.get("UV_TOOL_DIR"):
+        return os.environ["UV_TOOL_DIR"]
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(data_home, "uv", "tools")
+
+
+def _installed_version(name, system=None, user=None, tool_dir=None, env=None, **kwargs):
+    # Reads the version of a tool from its environment without invoking uv.
+    from packaging.requirements import InvalidRequirement, Requirement
+
+    try:
+        pkg = _normalize_name(Requirement(name).name)
+    except InvalidRequirement:
+        # e.g. a path or URL
+        return None
+    tool_dir = _get_tool_dir(system=system, user=user, tool_dir=tool_dir, env=env)
+    if tool_dir is None:
+        return None
+    return (_scan_site_packages(os.path.join(tool_dir, pkg)) or {}).get(pkg)
+
+
 def tool_is_installed(name, **kwargs):
     """
     Checks whether a tool with this name is installed by uv.
@@ -238,10 +315,23 @@ def tool_is_installed(name, **kwargs):
     user
         The username to check installation status for. Defaults to Salt user.
     """
+    tool_dir = _get_tool_dir(
+        system=kwargs.get("system"),
+        user=kwargs.get("user"),
+        tool_dir=kwargs.get("tool_dir"),
+        env=kwargs.get("env"),
+    )
+    if tool_dir is not None:
+        # uv writes a receipt into each tool environment it manages
+        return os.path.isfile(
+            os.path.join(tool_dir, _normalize_name(name), "uv-receipt.toml")
+        )
     return bool(tool_list([name], **kwargs))
 
 
-def get_latest_version(name, spec=None, endpoint="https://pypi.org/pypi/{}/json"):
+def get_latest_version(
+    name, spec=None, endpoint="https://pypi.org/simple/{}/", max_age=900
+):
     """
     Lookup the latest stable release of a package.
 
@@ -261,42 +351,374 @@ def get_latest_version(name, spec=None, endpoint="https://pypi.org/pypi/{}/json"
 
     endpoint
         JSON endpoint to query, containing a marker for the package name.
-        Defaults to ``https://pypi.org/pypi/{}/json``.
+        Can be a PEP 691 Simple API endpoint or a PyPI-style JSON API endpoint,
+        e.g. ``https://pypi.org/pypi/{}/json``.
+        If a ``.../simple/{}/`` endpoint does not serve JSON, the JSON API
+        of the same index (``.../pypi/{}/json``) is queried instead.
+        Defaults to ``https://pypi.org/simple/{}/``.
+
+    max_age
+        Responses are cached in the minion cache directory and revalidated
+        with the index on subsequent lookups. Within this number of seconds,
+        a cached response is used without contacting the index at all.
+        Set this to ``0`` to always revalidate. Defaults to ``900``.
     """
-    # for simplicity, this uses the pypi json endpoint,
-    # not the simple API (ironically) because it's html
-    # the latter would be preferred for compatibility reasons
-    api_url = endpoint.format(name)
+    api_url = endpoint.format(_normalize_name(name))
     log.info("Looking up version for %s at %s", name, api_url)
-    response = __salt__["http.query"](api_url, decode=True, decode_type="json")
-    if spec is None:
-        latest = response["dict"]["info"]["version"]
+    response = _index_response(
+        name, _query_index(name, api_url, max_age=max_age), endpoint, max_age
+    )
+    latest = _select_latest(name, response, spec)
+    log.info("Latest version: %s", latest)
+    return latest
+
+
+def get_latest_versions(
+    names, spec=None, endpoint="https://pypi.org/simple/{}/", max_age=900
+):
+    """
+    Lookup the latest stable releases of multiple packages at once.
+    If ``aiohttp`` is installed, the index is queried concurrently.
+
+    Returns a mapping of package name to latest version.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        salt '*' uv.get_latest_versions '[copier, ruff]'
+        salt '*' uv.get_latest_versions '[copier, {ruff: "<1"}]'
+
+    names
+        A list of package names to look up. List items can be a string
+        (the package name only) or a single-keyed mapping, where the key
+        is the name of the package and the value a version specifier.
+
+    spec
+        A version specifier to restrict the versions to consider for
+        packages that were passed without one.
+        If unspecified, returns the latest stable releases.
+
+    endpoint
+        JSON endpoint to query, containing a marker for the package name.
+        Can be a PEP 691 Simple API endpoint or a PyPI-style JSON API endpoint,
+        e.g. ``https://pypi.org/pypi/{}/json``.
+        If a ``.../simple/{}/`` endpoint does not serve JSON, the JSON API
+        of the same index (``.../pypi/{}/json``) is queried instead.
+        Defaults to ``https://pypi.org/simple/{}/``.
+
+    max_age
+        Use a cached index response not older than this number of seconds
+        without revalidating it. See ``get_latest_version``. Defaults to ``900``.
+    """
+    specs = {}
+    for pkg in names if isinstance(names, list) else [names]:
+        if isinstance(pkg, dict):
+            pkg, pkg_spec = next(iter(pkg.items()))
+        else:
+            pkg_spec = spec
+        specs[pkg] = pkg_spec
+    urls = {pkg: endpoint.format(_normalize_name(pkg)) for pkg in specs}
+    log.info("Looking up versions for %s", ", ".join(specs))
+
+    responses = None
+    if HAS_AIOHTTP and len(urls) > 1:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            responses = asyncio.run(_query_indexes(urls, max_age))
+        else:
+            log.debug("Running inside an event loop, querying index serially")
+    if responses is None:
+        responses = {
+            pkg: _query_index(pkg, url, max_age=max_age) for pkg, url in urls.items()
+        }
+    latest = {
+        pkg: _select_latest(
+            pkg, _index_response(pkg, responses[pkg], endpoint, max_age), specs[pkg]
+        )
+        for pkg in specs
+    }
+    log.info("Latest versions: %s", latest)
+    return latest
+
+
+def _select_latest(name, response, spec):
+    from packaging.specifiers import SpecifierSet
+    from packaging.version import InvalidVersion
+
+    if "versions" in response:
+        # PEP 691/700 Simple API
+        versions = response["versions"]
+        # Without any files, there is nothing to filter the versions by
+        available = (
+            _available_versions(response["files"]) if response.get("files") else None
+        )
+    elif "files" in response:
+        # PEP 691 Simple API before PEP 700 (API version 1.0) lists files only
+        versions = available = _available_versions(response["files"])
+    elif "releases" in response:
+        # PyPI JSON API
+        versions = response["releases"]
+        available = {
+            version
+            for version, files in versions.items()
+            if any(not file.get("yanked") for file in files)
+        }
     else:
-        version_spec = SpecifierSet(spec)
-        latest = next(
-            iter(
-                sorted(
-                    (
-                        version
-                        for version in response["dict"]["releases"]
-                        if (parsed := Version(version)) in version_spec
-                        and not parsed.is_prerelease
-                        and not parsed.is_devrelease
-                        and not parsed.is_postrelease
-                    ),
-                    reverse=True,
-                )
+        raise CommandExecutionError(f"Unrecognized index response for {name}")
+
+    version_spec = SpecifierSet(spec or "")
+    latest = None
+    for version in versions:
+        try:
+            parsed = _ver(version)
+        except InvalidVersion:
+            # Legacy, non-PEP 440 versions cannot be compared
+            continue
+        if (
+            (latest is None or parsed > latest[0])
+            and parsed in version_spec
+            and not parsed.is_prerelease
+            and not parsed.is_devrelease
+            and not parsed.is_postrelease
+            and (available is None or version in available or str(parsed) in available)
+        ):
+            latest = (parsed, version)
+    if latest is None:
+        raise CommandExecutionError(
+            f"Found no stable release of {name} matching '{spec or '*'}'"
+        )
+    return latest[1]
+
+
+def _available_versions(files):
+    # uv skips versions without files or whose files are all yanked.
+    # The file names are the only link between files and versions.
+    import packaging.utils
+    from packaging.version import InvalidVersion
+
+    available = set()
+    for file in files:
+        filename = file.get("filename", "")
+        try:
+            if filename.endswith(".whl"):
+                version = packaging.utils.parse_wheel_filename(filename)[1]
+            else:
+                version = packaging.utils.parse_sdist_filename(filename)[1]
+        except (
+            packaging.utils.InvalidSdistFilename,
+            packaging.utils.InvalidWheelFilename,
+            InvalidVersion,
+        ):
+            continue
+        if not file.get("yanked"):
+            available.add(str(version))
+    return available
+
+
+def _query_index(name, api_url, max_age=900):
+    # Conditional GET against an on-disk copy of the last response,
+    # modeled after pip's HTTP cache.
+    cached, meta, age = _read_index_cache(name, api_url)
+    if cached is not None and max_age and age < max_age:
+        log.debug("Using cached response for %s", api_url)
+        return cached
+    status, headers, body = _http_get(api_url, _index_headers(meta))
+    if status == 304 and cached is not None:
+        log.debug("Cached response for %s is still valid", api_url)
+        _touch_index_cache(name)
+        return cached
+    if (response := _parse_index_response(body, api_url)) is not None:
+        _write_index_cache(name, api_url, response, headers)
+    return response
+
+
+def _index_response(name, response, endpoint, max_age):
+    # Some indexes (or proxies) only serve HTML on the Simple API,
+    # but still offer the PyPI JSON API.
+    if response is None and endpoint.endswith("/simple/{}/"):
+        json_url = endpoint[: -len("simple/{}/")] + "pypi/{}/json"
+        response = _query_index(
+            name, json_url.format(_normalize_name(name)), max_age=max_age
+        )
+    if response is None:
+        raise CommandExecutionError(
+            f"Failed parsing the index response for {name}. "
+            "Does the index support JSON responses?"
+        )
+    return response
+
+
+def _http_get(url, headers):
+    if HAS_HTTPX:
+        import httpx
+
+        try:
+            resp = _get_http_client().get(url, headers=headers)
+        except httpx.HTTPError as err:
+            raise CommandExecutionError(f"Failed querying {url}: {err}") from err
+        if resp.is_error:
+            raise CommandExecutionError(
+                f"Failed querying {url}: HTTP {resp.status_code} {resp.reason_phrase}"
+            )
+        return resp.status_code, resp.headers, resp.text
+    res = __salt__["http.query"](
+        url,
+        header_dict=headers,
+        status=True,
+        headers=True,
+        text=True,
+    )
+    if res.get("status") != 304 and "error" in res:
+        raise CommandExecutionError(f"Failed querying {url}: {res['error']}")
+    return res.get("status"), res.get("headers"), res.get("text")
+
+
+def _get_http_client():
+    # A single client reuses connections (and HTTP/2, if h2 is installed)
+    # for all index requests during the lifetime of the process.
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        import httpx
+
+        client_opts = {
+            "follow_redirects": True,
+            "headers": {"User-Agent": "salt-tool-uv-formula"},
+            "timeout": 10.0,
+        }
+        try:
+            client = httpx.Client(http2=True, **client_opts)
+        except ImportError:
+            client = httpx.Client(**client_opts)
+        atexit.register(client.close)
+        _HTTP_CLIENT = client
+    return _HTTP_CLIENT
+
+
+async def _query_indexes(urls, max_age):
+    import aiohttp
+
+    # Same timeout and proxy handling as single lookups
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=16),
+        headers={"User-Agent": "salt-tool-uv-formula"},
+        timeout=aiohttp.ClientTimeout(total=10),
+        trust_env=True,
+    ) as session:
+        responses = await asyncio.gather(
+            *(
+                _query_index_async(session, pkg, url, max_age)
+                for pkg, url in urls.items()
             )
         )
-    log.info("Latest version: %s", latest)
-    return latest
+    return dict(zip(urls, responses))
+
+
+async def _query_index_async(session, name, api_url, max_age):
+    import aiohttp
+
+    cached, meta, age = _read_index_cache(name, api_url)
+    if cached is not None and max_age and age < max_age:
+        log.debug("Using cached response for %s", api_url)
+        return cached
+    try:
+        async with session.get(api_url, headers=_index_headers(meta)) as resp:
+            if resp.status == 304 and cached is not None:
+                log.debug("Cached response for %s is still valid", api_url)
+                _touch_index_cache(name)
+                return cached
+            resp.raise_for_status()
+            body = await resp.text()
+            headers = resp.headers
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        raise CommandExecutionError(
+            f"Failed querying {api_url}: {str(err) or type(err).__name__}"
+        ) from err
+    if (response := _parse_index_response(body, api_url)) is not None:
+        _write_index_cache(name, api_url, response, headers)
+    return response
+
+
+def _parse_index_response(body, api_url):
+    # Returns None for non-JSON (HTML) responses
+    try:
+        response = _loads(body)
+    except ValueError as err:
+        log.debug("Response from %s is not valid JSON: %s", api_url, err)
+        return None
+    return response if isinstance(response, dict) else None
+
+
+def _index_cache_file(name):
+    return Path(__opts__["cachedir"]) / "uv_pypi" / f"{_normalize_name(name)}.json"
+
+
+def _read_index_cache(name, api_url):
+    # Returns the cached response, its metadata and its age
+    try:
+        with open(_index_cache_file(name), encoding="utf-8") as fh_:
+            cached = _loads(fh_.read())
+            age = time.time() - os.fstat(fh_.fileno()).st_mtime
+    except (OSError, ValueError):
+        return None, None, None
+    if not isinstance(cached, dict) or cached.get("url") != api_url:
+        return None, None, None
+    return cached.get("response"), cached, age
+
+
+def _index_headers(meta):
+    # Prefer the Simple API JSON serialization, which is much smaller than
+    # the HTML one, but still accept the legacy JSON API.
+    headers = {"Accept": "application/vnd.pypi.simple.v1+json, application/json;q=0.9"}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last-modified"):
+            headers["If-Modified-Since"] = meta["last-modified"]
+    return headers
+
+
+def _touch_index_cache(name):
+    # Restart the max_age period
+    try:
+        _index_cache_file(name).touch()
+    except OSError as err:
+        log.warning("Failed updating cached response for %s: %s", name, err)
+
+
+def _write_index_cache(name, api_url, response, headers):
+    import salt.utils.atomicfile
+    import salt.utils.json
+
+    cache_file = _index_cache_file(name)
+    headers = {key.lower(): val for key, val in (headers or {}).items()}
+    # The cache is shared between concurrent Salt runs (and threads).
+    # Storing the response together with its validators in a single,
+    # atomically replaced file ensures readers never see a response
+    # paired with the ETag of another one.
+    data = salt.utils.json.dumps(
+        {
+            "url": api_url,
+            "etag": headers.get("etag"),
+            "last-modified": headers.get("last-modified"),
+            "response": response,
+        }
+    )
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with salt.utils.atomicfile.atomic_open(str(cache_file), "wb") as fh_:
+            fh_.write(data.encode("utf-8"))
+    except OSError as err:
+        log.warning("Failed caching response for %s: %s", api_url, err)
 
 
 def tool_is_outdated(
     name,
     spec=None,
-    endpoint="https://pypi.org/pypi/{}/json",
+    endpoint="https://pypi.org/simple/{}/",
     get_versions=False,
+    max_age=900,
     user=None,
     **kwargs,
 ):
@@ -308,9 +730,12 @@ def tool_is_outdated(
     .. code-block:: bash
 
         salt '*' uv.tool_is_outdated copier user=user
+        salt '*' uv.tool_is_outdated '[copier, ruff]' user=user
 
     name
-        The name of the package to check.
+        The name of the package to check. Can also be a list of names,
+        in which case a mapping of name to result is returned and the
+        index is queried for all of them at once.
 
     spec
         A version specification the latest check should fulfill.
@@ -319,12 +744,20 @@ def tool_is_outdated(
 
     endpoint
         JSON endpoint to query, containing a marker for the package name.
-        Defaults to ``https://pypi.org/pypi/{}/json``.
+        Can be a PEP 691 Simple API endpoint or a PyPI-style JSON API endpoint,
+        e.g. ``https://pypi.org/pypi/{}/json``.
+        If a ``.../simple/{}/`` endpoint does not serve JSON, the JSON API
+        of the same index (``.../pypi/{}/json``) is queried instead.
+        Defaults to ``https://pypi.org/simple/{}/``.
 
     get_versions
         Return a tuple of result, current version and latest version.
         Defaults to false.
 
+    max_age
+        Use a cached index response not older than this number of seconds
+        without revalidating it. See ``get_latest_version``. Defaults to ``900``.
+
     system
         Whether to operate on globally installed tools.
         Effectively, this defaults tool_bin_dir to ``/usr/local/bin`` and
@@ -335,22 +768,37 @@ def tool_is_outdated(
     user
         The username to check the package for. Defaults to Salt user.
     """
+    names = name if isinstance(name, list) else [name]
+    current = tool_list(names, user=user, **kwargs)
+    if len(names) == 1:
+        current = {names[0]: current} if current else {}
+    if missing := [tool for tool in names if tool not in current]:
+        raise CommandExecutionError(
+            f"{', '.join(missing)} {'is' if len(missing) == 1 else 'are'} "
+            f"not installed for user {user}."
+        )
 
-    current = tool_list([name], user=user, **kwargs)
-    if not current:
-        raise CommandExecutionError(f"{name} is not installed for user {user}.")
-
-    if spec is False:
-        spec = None
-    elif spec is None:
-        spec = current["install_spec"] or None
-
-    latest = get_latest_version(name, spec=spec, endpoint=endpoint)
-
-    res = Version(current["version"]) < Version(latest)
-    if get_versions:
-        return res, current["version"], latest
-    return res
+    specs = []
+    for tool in names:
+        if spec is False:
+            tool_spec = None
+        elif spec is None:
+            tool_spec = current[tool]["install_spec"] or None
+        else:
+            tool_spec = spec
+        specs.append({tool: tool_spec})
+
+    latest = get_latest_versions(specs, endpoint=endpoint, max_age=max_age)
+
+    ret = {}
+    for tool in names:
+        res = _ver(current[tool]["version"]) < _ver(latest[tool])
+        if get_versions:
+            res = (res, current[tool]["version"], latest[tool])
+        ret[tool] = res
+    if not isinstance(name, list):
+        return ret[name]
+    return ret
 
 
 def tool_install(
@@ -366,16 +814,19 @@ def tool_install(
 ):
     """
     Installs tool with uv.
+    Returns the installed version of the tool if it can be read from
+    its environment, otherwise true.
 
     CLI Example:
 
     .. code-block:: bash
 
         salt '*' uv.tool_install copier user=user
+        salt '*' uv.tool_install 'copier<10' user=user
         salt '*' uv.tool_install copier extras='[copier-templates-extensions]' user=user
 
     name
-        The name of the package to install.
+        The name of the package to install. Can include a version specifier.
 
     extras
         Inject additional packages into the tool's virtual environment.
@@ -450,10 +901,18 @@ def tool_install(
     if force:
         options.append("--force")
     _tool_install_upgrade("install", name, **kwargs, options=options)
-    return True
+    return _installed_version(name, **kwargs) or True
 
 
-def tool_list(name=None, system=None, user=None, **kwargs):
+def tool_list(
+    name=None,
+    system=None,
+    user=None,
+    max_workers=None,
+    accurate=False,
+    resolve_python=False,
+    **kwargs,
+):
     """
     List tools installed by uv.
 
@@ -476,7 +935,68 @@ def tool_list(name=None, system=None, user=None, **kwargs):
 
     user
         The username to list installed packages for. Defaults to Salt user.
+
+    max_workers
+        The maximum number of tool environments to inspect concurrently.
+        Defaults to ``32``.
+
+    accurate
+        Query ``uv pip list`` for the packages installed into each tool
+        environment instead of reading the package metadata from
+        ``site-packages`` directly. Slower, but reports editable installs
+        the way uv does. Defaults to false.
+
+    resolve_python
+        Report the canonical path of each tool environment's Python
+        interpreter, i.e. with all symlinks resolved, instead of
+        the path inside the environment. Defaults to false.
     """
+    probe_opts = {"accurate": accurate, "resolve_python": resolve_python}
+    if name is not None and not isinstance(name, list):
+        name = [name]
+    # Listing all tools is cached for the duration of the Salt run,
+    # mutating functions in this module invalidate the cache.
+    cache = __context__.setdefault("uv.tool_list", {})
+    cache_key = _tool_list_cache_key(system, user, probe_opts, kwargs)
+    if (tools := cache.get(cache_key)) is None:
+        tools = _list_tools(name, system, user, max_workers, probe_opts, kwargs)
+        if name is None:
+            cache[cache_key] = tools
+    if name is not None:
+        tools = {tool: info for tool, info in tools.items() if tool in name}
+        if len(name) == 1 and tools:
+            return copy.deepcopy(tools[name[0]])
+    # Callers must not be able to modify the cached listing
+    return copy.deepcopy(tools)
+
+
+def _tool_list_cache_key(system, user, probe_opts, kwargs):
+    # Any option passed on to uv can change the listing. Dunder kwargs
+    # (e.g. __pub_jid) are injected by Salt and ignored by _uv.
+    return (
+        system,
+        user,
+        _freeze(probe_opts),
+        _freeze({opt: val for opt, val in kwargs.items() if not opt.startswith("__")}),
+    )
+
+
+def _freeze(val):
+    # Hashable representation of nested options
+    if isinstance(val, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in val.items()))
+    if isinstance(val, (list, tuple)):
+        return tuple(_freeze(item) for item in val)
+    return val
+
+
+def _clear_tool_list_cache():
+    # Call this after uv has modified the tools. Listings that were started
+    # concurrently store their (possibly stale) result in the dropped dict.
+    __context__.pop("uv.tool_list", None)
+
+
+def _list_tools(name, system, user, max_workers, probe_opts, kwargs):
     out = _uv_tool(
         "list",
         **kwargs,
@@ -487,44 +1007,149 @@ def tool_list(name=None, system=None, user=None, **kwargs):
     if "No tools installed" in out:
         return {}
     tools = {}
-    if name is not None and not isinstance(name, list):
-        name = [name]
+    # Resolve the loader lookup once instead of in each worker
+    cmd_run = __salt__["cmd.run"]
+    # Each probe is submitted as soon as its line has been parsed. Workers are
+    # only started on demand, so this never starts more threads than matches.
+    with ThreadPoolExecutor(max_workers=max_workers or 32) as executor:
+        # The Salt loader dunders are bound to the current context,
+        # so each worker needs to run inside a copy of it.
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _probe_venv,
+                match,
+                user,
+                kwargs,
+                cmd_run,
+                **probe_opts,
+            )
+            for match in _parse_tool_list(out)
+            if name is None or match.group("tool") in name
+        ]
+        for future in as_completed(futures):
+            tool, info = future.result()
+            tools[tool] = info
+    return tools
+
+
+def _parse_tool_list(out):
+    # Yields a match per tool, but still reports lines that were not
+    # consumed by the regex instead of silently dropping the tools.
+    pos = 0
+    for match in LIST_REGEX.finditer(out):
+        _log_unparsed(out[pos : match.start()])
+        pos = match.end()
+        yield match
+    _log_unparsed(out[pos:])
+
+
+def _log_unparsed(out):
     for line in out.splitlines():
-        if line.startswith("-"):
-            # lists executables
-            continue
-        if not (match := LIST_REGEX.match(line)):
+        if line.strip() and not line.startswith("-"):
             log.error(f"Failed parsing uv output: {line}")
-            continue
-        tool, version, spec, venv = match.groups()
-        if name is not None and tool not in name:
-            continue
-        venv_pkgs = {}
-        pip_list_opts = kwargs.copy()
+
+
+def _probe_venv(match, user, kwargs, cmd_run, accurate=False, resolve_python=False):
+    tool, version, spec, venv = match.groups()
+    venv_pkgs = None if accurate else _scan_site_packages(venv)
+    if venv_pkgs is None:
+        pip_list_opts = {
+            opt: val
+            for opt, val in kwargs.items()
+            if opt not in ("tool_bin_dir", "tool_dir")
+        }
         pip_list_opts["directory"] = venv
-        for pkg in _uv(
+        out = _uv(
             ["pip", "list"],
             **pip_list_opts,
-            options=["--format", "json"],
+            options=["--format", "freeze"],
             user=user,
-            json=True,
-        ):
-            venv_pkgs[pkg["name"]] = pkg["version"]
-        venv_py = (Path(venv) / "bin" / "python").resolve()
-        venv_pyver = __salt__["cmd.run"](
-            shlex.join((str(venv_py), "--version")), runas=user
+        )
+        venv_pkgs = dict(
+            line.split("==", maxsplit=1) for line in out.splitlines() if "==" in line
+        )
+    venv_py = os.path.join(venv, "bin", "python")
+    if resolve_python:
+        venv_py = os.path.realpath(venv_py)
+    venv_pyver = _read_pyvenv_version(venv)
+    if venv_pyver is None:
+        venv_pyver = cmd_run(
+            [venv_py, "--version"], runas=user, python_shell=False
         ).rsplit(" ", maxsplit=1)[-1]
-        tools[tool] = {
-            "python": str(venv_py),
-            "python_version": venv_pyver,
-            "install_spec": spec or None,
-            "version": version,
-            "venv_path": venv,
-            "pkgs": venv_pkgs,
-        }
-    if name is not None and len(name) == 1 and tools:
-        return tools[name[0]]
-    return tools
+    return tool, {
+        "python": venv_py,
+        "python_version": venv_pyver,
+        "install_spec": spec or None,
+        "version": version,
+        "venv_path": venv,
+        "pkgs": venv_pkgs,
+    }
+
+
+def _scan_site_packages(venv):
+    # Collect name/version from the core metadata of all distributions
+    # installed into the environment, which is what `uv pip list` does as well.
+    site_packages = glob.glob(
+        os.path.join(glob.escape(venv), "lib", "python*", "site-packages")
+    )
+    if not site_packages:
+        return None
+    pkgs = {}
+    try:
+        for site_dir in site_packages:
+            with os.scandir(site_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".dist-info") or not entry.is_dir():
+                        continue
+                    pkg_name, pkg_version = _read_dist_info(entry.path)
+                    if pkg_name and pkg_version:
+                        pkgs[_normalize_name(pkg_name)] = pkg_version
+    except (OSError, UnicodeDecodeError) as err:
+        # The environment might not be readable by the minion user,
+        # let uv list the packages instead (as the target user).
+        log.debug("Failed scanning %s: %s", venv, err)
+        return None
+    return pkgs
+
+
+def _read_dist_info(path):
+    pkg_name = pkg_version = None
+    with open(os.path.join(path, "METADATA"), encoding="utf-8") as metadata:
+        for line in metadata:
+            if not line.strip():
+                # end of the header section
+                break
+            key, sep, val = line.partition(":")
+            if not sep:
+                continue
+            if key == "Name":
+                pkg_name = val.strip()
+            elif key == "Version":
+                pkg_version = val.strip()
+            if pkg_name and pkg_version:
+                break
+    return pkg_name, pkg_version
+
+
+def _normalize_name(name):
+    # PEP 503, uv reports normalized names
+    return NORMALIZE_REGEX.sub("-", name).lower()
+
+
+def _read_pyvenv_version(venv):
+    # Virtual environments record the interpreter version in pyvenv.cfg
+    # (``version`` for venv/virtualenv, ``version_info`` for uv),
+    # which saves starting the interpreter just to ask it.
+    try:
+        with open(Path(venv) / "pyvenv.cfg", encoding="utf-8") as cfg:
+            for line in cfg:
+                key, sep, val = line.partition("=")
+                if sep and key.strip() in ("version", "version_info"):
+                    return val.strip()
+    except (OSError, UnicodeDecodeError) as err:
+        log.debug("Failed reading pyvenv.cfg of %s: %s", venv, err)
+    return None
 
 
 def tool_remove(name, **kwargs):
@@ -550,7 +1175,10 @@ def tool_remove(name, **kwargs):
     user
         The username to remove the package for. Defaults to Salt user.
     """
-    _uv_tool("uninstall", name, **kwargs)
+    try:
+        _uv_tool("uninstall", name, **kwargs)
+    finally:
+        _clear_tool_list_cache()
     return True
 
 
@@ -574,7 +1202,10 @@ def tool_remove_all(**kwargs):
     user
         The username to remove all tools for. Defaults to Salt user.
     """
-    _uv_tool("uninstall", **kwargs, options=["--all"])
+    try:
+        _uv_tool("uninstall", **kwargs, options=["--all"])
+    finally:
+        _clear_tool_list_cache()
     return True
 
 
@@ -585,6 +1216,8 @@ def tool_upgrade(name, **kwargs):
     does not upgrade beyond it.
     If you want to upgrade beyond, reinstall the tool with a
     different specifier.
+    Returns the installed version of the tool if it can be read from
+    its environment, otherwise true.
 
     CLI Example:
 
@@ -615,7 +1248,8 @@ def tool_upgrade(name, **kwargs):
     user
         The username to upgrade the package for. Defaults to Salt user.
     """
-    return _tool_install_upgrade("upgrade", name, **kwargs)
+    _tool_install_upgrade("upgrade", name, **kwargs)
+    return _installed_version(name, **kwargs) or True
 
 
 def tool_upgrade_all(**kwargs):
@@ -660,7 +1294,8 @@ def _tool_install_upgrade(
 ):
     # There's a bunch of options common to the install/upgrade interface,
     # consider their relevance.
-    options = options or []
+    # Never mutate the caller's list
+    options = list(options or ())
     if python is not None:
         options.extend(("--python", python))
     if upgrade:
@@ -671,5 +1306,8 @@ def _tool_install_upgrade(
         ):
             options.extend(("--upgrade-package", pkg))
 
-    _uv_tool(cmd, *args, **kwargs, options=options)
+    try:
+        _uv_tool(cmd, *args, **kwargs, options=options)
+    finally:
+        _clear_tool_list_cache()
     return True
@@ -2,24 +2,54 @@
 Statefully manage tools installed via ``uv``.
 """
 
-import json
+import contextvars
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-from packaging.specifiers import SpecifierSet
-from packaging.version import Version
 from salt.exceptions import CommandExecutionError, SaltInvocationError
 
 log = logging.getLogger(__name__)
 
 __virtualname__ = "uv_tool"
 
+_IS_ROOT = hasattr(os, "getuid") and os.getuid() == 0
+
+_BULK_TOOL_PARAMS = (
+    "name",
+    "version_spec",
+    "upgrade",
+    "extras",
+    "refresh",
+    "refresh_package",
+    "force",
+    "python",
+    "verify",
+)
+
 
 def __virtual__():
     return __virtualname__
 
 
+@lru_cache(maxsize=512)
+def _ver(version):
+    # Parsed versions/specifiers are immutable, parsing them is not free.
+    # packaging is imported on first use, absent never needs it.
+    from packaging.version import Version
+
+    return Version(version)
+
+
+@lru_cache(maxsize=512)
+def _specset(spec):
+    from packaging.specifiers import SpecifierSet
+
+    return SpecifierSet(spec)
+
+
 def installed(
     name,
     version_spec=None,
@@ -31,6 +61,7 @@ def installed(
     python=None,
     system=None,
     user=None,
+    verify=False,
     **kwargs,
 ):
     """
@@ -92,8 +123,44 @@ def installed(
 
     user
         The username to install the package for. Defaults to Salt user.
+
+    verify
+        After installing, always list the tool again and check all
+        requested properties. By default, this is only done when
+        ``python`` or ``extras`` changed or the installed version
+        could not be read from the tool environment. Defaults to false.
     """
+    return _installed(
+        name,
+        version_spec=version_spec,
+        upgrade=upgrade,
+        extras=extras,
+        refresh=refresh,
+        refresh_package=refresh_package,
+        force=force,
+        python=python,
+        system=system,
+        user=user,
+        verify=verify,
+        **kwargs,
+    )
 
+
+def _installed(
+    name,
+    version_spec=None,
+    upgrade=False,
+    extras=None,
+    refresh=False,
+    refresh_package=None,
+    force=False,
+    python=None,
+    system=None,
+    user=None,
+    verify=False,
+    latest_cache=None,
+    **kwargs,
+):
     ret = {
         "name": name,
         "result": True,
@@ -101,85 +168,114 @@ def installed(
         "changes": {},
     }
 
+    # Shared between the checks before and after installation
+    # and, in installed_bulk, between tools
+    if latest_cache is None:
+        latest_cache = {}
+    python_resolved = str(Path(python).resolve()) if python is not None else None
+    extras = _normalize_extras(extras)
+
+    def _latest_versions(lookups):
+        if missing := [lookup for lookup in lookups if lookup not in latest_cache]:
+            latest_cache.update(_resolve_latest_versions(missing))
+        return latest_cache
+
     def _check_changes(curr):
+        if (
+            version_spec is None
+            and extras is None
+            and python is None
+            and not upgrade
+            and curr["install_spec"] is None
+        ):
+            # Nothing to compare against
+            return {}, False
         changes = {}
         requires_install = False
-        if python is not None and curr["python"] != str(Path(python).resolve()):
+        if python is not None and curr["python"] != python_resolved:
             changes["python"] = {"old": curr["python"], "new": python}
+        # Find out which latest versions are needed first,
+        # then look them up in a single batch.
+        extra_misses = {}
+        extra_upgrades = {}
         if extras is not None:
-            extra_misses = {}
-            for extra in extras if isinstance(extras, list) else [extras]:
-                if isinstance(extra, str):
-                    extra_pkg, extra_spec = extra, None
-                else:
-                    extra_pkg, extra_spec = next(iter(extra.items()))
-                if extra_pkg not in curr["pkgs"]:
-                    extra_misses[extra_pkg] = {
-                        "old": None,
-                        "new": __salt__["uv.get_latest_version"](
-                            extra_pkg, spec=extra_spec
-                        ),
-                    }
-                    continue
-                if extra_spec is not None and Version(
-                    curr["pkgs"][extra_pkg]
-                ) not in SpecifierSet(extra_spec):
-                    extra_misses[extra_pkg] = {
-                        "old": curr["pkgs"][extra_pkg],
-                        "new": __salt__["uv.get_latest_version"](
-                            extra_pkg, spec=extra_spec
-                        ),
-                    }
+            for extra_pkg, extra_spec in extras:
+                if (old := curr["pkgs"].get(extra_pkg)) is None:
+                    extra_misses[extra_pkg] = (None, extra_spec)
                     continue
-                if upgrade:
-                    new_version = __salt__["uv.get_latest_version"](
-                        extra_pkg, spec=extra_spec
-                    )
-                    if Version(curr["pkgs"][extra_pkg]) < Version(new_version):
-                        extra_misses[extra_pkg] = {
-                            "old": curr["pkgs"][extra_pkg],
-                            "new": new_version,
-                        }
-                        continue
-
-            if extra_misses:
-                changes["extras"] = extra_misses
-                requires_install = True
-
-        if curr["install_spec"] != version_spec:
+                old_ver = _ver(old)
+                if extra_spec is not None and old_ver not in _specset(extra_spec):
+                    extra_misses[extra_pkg] = (old, extra_spec)
+                elif upgrade:
+                    extra_upgrades[extra_pkg] = (old_ver, extra_spec)
+
+        # uv reformats specifiers (e.g. `>=2.0,<3` is listed as `>=2.0, <3`)
+        spec_changed = _specset(curr["install_spec"] or "") != _specset(
+            version_spec or ""
+        )
+        # This should not happen usually since it would be a bug in uv,
+        # but let's check it anyways (maybe the venv was mutated manually)
+        version_mismatch = (
+            not spec_changed
+            and version_spec is not None
+            and _ver(curr["version"]) not in _specset(version_spec)
+        )
+
+        lookups = [
+            (extra_pkg, extra_spec)
+            for pending in (extra_misses, extra_upgrades)
+            for extra_pkg, (_, extra_spec) in pending.items()
+        ]
+        if spec_changed or version_mismatch or upgrade:
+            lookups.append((name, version_spec))
+        latest_versions = _latest_versions(lookups)
+
+        extra_changes = {
+            extra_pkg: {"old": old, "new": latest_versions[(extra_pkg, extra_spec)]}
+            for extra_pkg, (old, extra_spec) in extra_misses.items()
+        }
+        for extra_pkg, (old_ver, extra_spec) in extra_upgrades.items():
+            old = curr["pkgs"][extra_pkg]
+            new_version = latest_versions[(extra_pkg, extra_spec)]
+            # Skip parsing when the latest version is already installed
+            if old != new_version and old_ver < _ver(new_version):
+                extra_changes[extra_pkg] = {"old": old, "new": new_version}
+        if extra_changes:
+            changes["extras"] = extra_changes
+            requires_install = True
+
+        if spec_changed:
             changes["version_spec"] = {"old": curr["install_spec"], "new": version_spec}
             requires_install = True
-            new_version = __salt__["uv.get_latest_version"](name, spec=version_spec)
-            if Version(curr["version"]) != Version(new_version):
+            new_version = latest_versions[(name, version_spec)]
+            if curr["version"] != new_version and (
+                _ver(curr["version"]) != _ver(new_version)
+            ):
                 changes["version"] = {"old": curr["version"], "new": new_version}
 
-        if version_spec is not None and "version_spec" not in changes:
-            if Version(curr["version"]) not in SpecifierSet(version_spec):
-                # This should not happen usually since it would be a bug in uv,
-                # but let's check it anyways (maybe the venv was mutated manually)
-                changes["version"] = {
-                    "old": curr["version"],
-                    "new": __salt__["uv.get_latest_version"](name, spec=version_spec),
-                }
-                requires_install = True
+        if version_mismatch:
+            changes["version"] = {
+                "old": curr["version"],
+                "new": latest_versions[(name, version_spec)],
+            }
+            requires_install = True
 
         if upgrade and "version" not in changes:
-            needs_upgrade, curr_ver, latest_ver = __salt__["uv.tool_is_outdated"](
-                name,
-                spec=version_spec or False,
-                system=system,
-                user=user,
-                get_versions=True,
-                **kwargs,
-            )
-            if needs_upgrade:
-                changes["version"] = {"old": curr_ver, "new": latest_ver}
+            # The current version is known already, no need to ask
+            # uv.tool_is_outdated to list the tool again.
+            new_version = latest_versions[(name, version_spec)]
+            if curr["version"] != new_version and (
+                _ver(curr["version"]) < _ver(new_version)
+            ):
+                changes["version"] = {"old": curr["version"], "new": new_version}
         return changes, requires_install
 
     try:
-        if system is None and user is None and os.getuid() == 0:
+        if system is None and user is None and _IS_ROOT:
             system = True
-        curr = __salt__["uv.tool_list"]([name], system=system, user=user, **kwargs)
+        curr = _cached_tool_list(
+            system=system, user=user, resolve_python=python is not None, **kwargs
+        ).get(name)
         changes = {}
         if curr:
             changes, requires_install = _check_changes(curr)
@@ -190,55 +286,79 @@ def installed(
             return ret
         if __opts__["test"]:
             ret["result"] = None
-            ret[
-                "comment"
-            ] = f"The tool would have been {'re' if curr else ''}installed " + (
-                "globally" if system else f"for user {user}"
+            ret["comment"] = (
+                f"The tool would have been {'re' if curr else ''}installed "
+                f"{'globally' if system else f'for user {user}'}"
             )
             ret["changes"] = changes
             return ret
-        cmd_kwargs = kwargs.copy()
-        cmd_kwargs.update(
-            {
+        if requires_install:
+            cmd = "install"
+            cmd_kwargs = {
+                **kwargs,
                 "python": python,
                 "system": system,
                 "user": user,
+                "refresh": refresh,
+                "refresh_package": refresh_package,
+                "reinstall": bool(curr),
+                "force": force,
             }
-        )
-        if requires_install:
-            cmd = "install"
-            cmd_kwargs.update(
-                {
-                    "refresh": refresh,
-                    "refresh_package": refresh_package,
-                    "reinstall": bool(curr),
-                    "force": force,
-                }
-            )
             if extras is not None:
                 cmd_kwargs["extras"] = [
-                    "".join(next(iter(extra.items())))
-                    if isinstance(extra, dict)
-                    else extra
-                    for extra in (extras if isinstance(extras, list) else [extras])
+                    extra_pkg if extra_spec is None else extra_pkg + extra_spec
+                    for extra_pkg, extra_spec in extras
                 ]
         else:
             cmd = "upgrade"
-            cmd_kwargs["upgrade"] = upgrade
-
-        __salt__[f"uv.tool_{cmd}"](name, **cmd_kwargs)
-        new = __salt__["uv.tool_list"]([name], system=system, user=user, **kwargs)
-        if not new:
-            raise CommandExecutionError(
-                f"There were no errors during installation, but '{name}' is still not installed"
-            )
+            cmd_kwargs = {
+                **kwargs,
+                "python": python,
+                "system": system,
+                "user": user,
+                "upgrade": upgrade,
+            }
 
-        if new_changes := _check_changes(new)[0]:
-            raise CommandExecutionError(
-                f"Installation succeeded, but there are still pending changes: {json.dumps(new_changes)}"
-            )
-        ret["comment"] = f"The tool has been {'re' if curr else ''}installed " + (
-            "globally" if system else f"for user {user}"
+        target = name
+        if requires_install and version_spec is not None:
+            target += version_spec
+        installed_version = __salt__[f"uv.tool_{cmd}"](target, **cmd_kwargs)
+
+        if (
+            verify
+            or not isinstance(installed_version, str)
+            or "python" in changes
+            or "extras" in changes
+            or "version_spec" in changes
+        ):
+            new = _cached_tool_list(
+                system=system, user=user, resolve_python=python is not None, **kwargs
+            ).get(name)
+            if not new:
+                raise CommandExecutionError(
+                    f"There were no errors during installation, but '{name}' is still not installed"
+                )
+
+            if new_changes := _check_changes(new)[0]:
+                raise CommandExecutionError(
+                    f"Installation succeeded, but there are still pending changes: {new_changes!r}"
+                )
+        else:
+            # Only the tool version itself was supposed to change,
+            # which the install command reported back. A changed install spec
+            # is only reported by the listing, hence rechecked above.
+            expected = changes.get("version", {}).get("new")
+            if (
+                version_spec is not None
+                and _ver(installed_version) not in _specset(version_spec)
+            ) or (expected is not None and _ver(installed_version) < _ver(expected)):
+                raise CommandExecutionError(
+                    f"Installation succeeded, but '{name}' is at version "
+                    f"{installed_version} instead of {expected or version_spec}"
+                )
+        ret["comment"] = (
+            f"The tool has been {'re' if curr else ''}installed "
+            f"{'globally' if system else f'for user {user}'}"
         )
         ret["changes"] = changes
     except (CommandExecutionError, SaltInvocationError) as err:
@@ -317,6 +437,126 @@ def latest(
     )
 
 
+def installed_bulk(name, tools, system=None, user=None, max_workers=4, **kwargs):
+    """
+    Ensure multiple tools are installed with uv.
+    The tools are checked and installed concurrently, sharing a single
+    tool listing and latest version lookups.
+
+    .. note::
+
+        There are additional undocumented parameters, see the ``uv``
+        execution module for details. They apply to all tools.
+
+    name
+        An arbitrary name for the state.
+
+    tools
+        A list of tools to install. List items can be a string (the name
+        of the tool only) or a mapping of parameters for ``installed``
+        (``name``, ``version_spec``, ``upgrade``, ``extras``, ``refresh``,
+        ``refresh_package``, ``force``, ``python`` and ``verify``).
+        Any of these except ``name`` can also be passed to this state
+        directly as a default for all tools.
+
+    system
+        Whether to operate on globally installed tools.
+        Effectively, this defaults tool_bin_dir to ``/usr/local/bin`` and
+        ``tool_dir`` to ``/opt/uv/tools``.
+        If this command is executed as root and no ``user`` is specified,
+        defaults to true, otherwise to false.
+
+    max_workers
+        The maximum number of tools to process concurrently.
+        Defaults to ``4``.
+
+    tool_bin_dir
+        The directory that should contain the installed executables.
+
+    tool_dir
+        The directory that contains virtual environments for installed tools.
+
+    user
+        The username to install the packages for. Defaults to Salt user.
+    """
+
+    ret = {
+        "name": name,
+        "result": True,
+        "comment": "All tools are installed as specified",
+        "changes": {},
+    }
+
+    try:
+        if system is None and user is None and _IS_ROOT:
+            system = True
+        # Parameters for installed given for all tools are defaults, the rest
+        # is passed through to the execution module.
+        common = {
+            param: kwargs.pop(param) for param in _BULK_TOOL_PARAMS if param in kwargs
+        }
+        tool_params = []
+        for tool in tools if isinstance(tools, list) else [tools]:
+            params = {"name": tool} if isinstance(tool, str) else dict(tool)
+            if "name" not in params:
+                raise SaltInvocationError(f"Missing tool name in {tool!r}")
+            if invalid := set(params).difference(_BULK_TOOL_PARAMS):
+                raise SaltInvocationError(
+                    f"Invalid parameters for tool {params['name']}: "
+                    + ", ".join(sorted(invalid))
+                )
+            tool_params.append({**common, **params})
+
+        # List the tools once up front, otherwise all workers would miss
+        # the cache and list them concurrently.
+        for resolve_python in {
+            params.get("python") is not None for params in tool_params
+        }:
+            _cached_tool_list(
+                system=system, user=user, resolve_python=resolve_python, **kwargs
+            )
+        # Tools that should be upgraded always need their latest versions
+        lookups = []
+        for params in tool_params:
+            if not params.get("upgrade"):
+                continue
+            lookups.append((params["name"], params.get("version_spec")))
+            lookups.extend(_normalize_extras(params.get("extras")) or ())
+        latest_cache = _resolve_latest_versions(lookups)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # See uv._list_tools on why workers run in a context copy
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    _installed,
+                    **kwargs,
+                    **params,
+                    system=system,
+                    user=user,
+                    latest_cache=latest_cache,
+                )
+                for params in tool_params
+            ]
+            results = [future.result() for future in futures]
+    except (CommandExecutionError, SaltInvocationError) as err:
+        ret["result"] = False
+        ret["comment"] = str(err)
+        return ret
+
+    comments = []
+    for res in results:
+        if res["changes"]:
+            ret["changes"][res["name"]] = res["changes"]
+        if res["result"] is False:
+            ret["result"] = False
+        elif res["result"] is None and ret["result"] is not False:
+            ret["result"] = None
+        comments.append(f"{res['name']}: {res['comment']}")
+    ret["comment"] = "\n".join(comments) or ret["comment"]
+    return ret
+
+
 def absent(name, system=None, user=None, **kwargs):
     """
     Ensure a tool is not installed with uv.
@@ -354,7 +594,7 @@ def absent(name, system=None, user=None, **kwargs):
     }
 
     try:
-        if system is None and user is None and os.getuid() == 0:
+        if system is None and user is None and _IS_ROOT:
             system = True
         if not __salt__["uv.tool_is_installed"](
             name, system=system, user=user, **kwargs
@@ -362,8 +602,9 @@ def absent(name, system=None, user=None, **kwargs):
             return ret
         if __opts__["test"]:
             ret["result"] = None
-            ret["comment"] = "The tool would have been removed " + (
-                "globally" if system else f"for user {user}"
+            ret["comment"] = (
+                "The tool would have been removed "
+                f"{'globally' if system else f'for user {user}'}"
             )
             ret["changes"] = {"removed": name}
             return ret
@@ -372,8 +613,9 @@ def absent(name, system=None, user=None, **kwargs):
             raise CommandExecutionError(
                 "There were no errors during uninstallation, but the tool is still reported as installed"
             )
-        ret["comment"] = "The tool has been removed " + (
-            "globally" if system else f"for user {user}"
+        ret["comment"] = (
+            "The tool has been removed "
+            f"{'globally' if system else f'for user {user}'}"
         )
         ret["changes"] = {"removed": name}
     except (CommandExecutionError, SaltInvocationError) as err:
@@ -381,3 +623,44 @@ def absent(name, system=None, user=None, **kwargs):
         ret["comment"] = str(err)
 
     return ret
+
+
+def _normalize_extras(extras):
+    # Extras can be passed as a single item or a list of names
+    # and single-item ``{name: spec}`` mappings
+    if extras is None:
+        return None
+    return [
+        (extra, None) if isinstance(extra, str) else next(iter(extra.items()))
+        for extra in (extras if isinstance(extras, list) else [extras])
+    ]
+
+
+def _cached_tool_list(**kwargs):
+    # The execution module caches the complete listing during the Salt run,
+    # so sibling states share a single `uv tool list` invocation.
+    return __salt__["uv.tool_list"](None, **kwargs)
+
+
+def _resolve_latest_versions(lookups):
+    # Maps (package, spec) pairs to their latest versions,
+    # looked up in as few batches as possible.
+    resolved = {}
+    pending = list(dict.fromkeys(lookups))
+    while pending:
+        # The execution module returns a single version per package name,
+        # so the same package with different specs needs another round.
+        batch, deferred = {}, []
+        for pkg, spec in pending:
+            if pkg in batch:
+                deferred.append((pkg, spec))
+            else:
+                batch[pkg] = spec
+        latest_versions = __salt__["uv.get_latest_versions"](
+            [{pkg: spec} for pkg, spec in batch.items()]
+        )
+        resolved.update(
+            {(pkg, spec): latest_versions[pkg] for pkg, spec in batch.items()}
+        )
+        pending = deferred
+    return resolved